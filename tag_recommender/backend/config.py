@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 import os
 
@@ -29,14 +29,12 @@ class Settings(BaseSettings):
     max_text_length: int = 2048
     max_images: int = 10
     max_videos: int = 5
-    image_size: tuple = (224, 224)
+    image_size: tuple[int, int] = (224, 224)
     
     # CORS Settings
-    allowed_origins: list = ["*"]  # In production, specify your WordPress domain
+    allowed_origins: tuple[str, ...] = ("*",)  # In production, specify your WordPress domain
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, frozen=True)
 
 # Create global settings instance
 settings = Settings()
@@ -1,29 +1,40 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import List, Optional
 import uvicorn
 
 from services.tag_recommender import TagRecommender
+from middleware import MinimalCORS
 from config import settings
 
-app = FastAPI(title="iCog Tag Recommender API", version="1.0.0")
+# Initialize tag recommender (models are loaded lazily)
+tag_recommender = TagRecommender()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the models in the background once the server is accepting requests"""
+    # The loading thread can't be cancelled, so shutdown during warm-up waits for it
+    warm_up = asyncio.create_task(asyncio.to_thread(tag_recommender.warm_up))
+    yield
 
-# Configure CORS for WordPress integration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your WordPress domain
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+app = FastAPI(
+    title="iCog Tag Recommender API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Mount static files for the simple UI
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# Configure CORS for WordPress integration (set ALLOWED_ORIGINS in production)
+app.add_middleware(MinimalCORS)
 
-# Initialize tag recommender
-tag_recommender = TagRecommender()
+# Mount static files for the simple UI (in production serve them from nginx/CDN)
+static_dir = settings.base_dir / "static"
+if settings.debug and static_dir.is_dir():
+    app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 class RecommendationRequest(BaseModel):
     text: str
@@ -52,7 +63,7 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "tag_recommender"}
 
-@app.post("/recommend/json", response_model=RecommendationResponse)
+@app.post("/recommend/json", response_class=ORJSONResponse, response_model=RecommendationResponse)
 async def recommend_tags(request: RecommendationRequest):
     """
     Main endpoint for tag recommendation.
@@ -0,0 +1,46 @@
+from config import settings
+
+class MinimalCORS:
+    """Lightweight ASGI CORS handling for the WordPress integration"""
+    
+    def __init__(self, app, allow_origins=settings.allowed_origins):
+        self.app = app
+        self.allow_all = "*" in allow_origins
+        self.allow_origins = {origin.encode() for origin in allow_origins}
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_headers = dict(scope["headers"])
+        origin = request_headers.get(b"origin")
+        if self.allow_all:
+            cors_headers = [(b"access-control-allow-origin", b"*")]
+        elif origin in self.allow_origins:
+            cors_headers = [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+        else:
+            cors_headers = [(b"vary", b"Origin")]
+        
+        # Answer CORS preflight requests directly; other OPTIONS requests reach the app
+        is_preflight = (
+            scope["method"] == "OPTIONS"
+            and origin is not None
+            and b"access-control-request-method" in request_headers
+        )
+        if is_preflight:
+            requested_headers = request_headers.get(b"access-control-request-headers")
+            cors_headers.append((b"access-control-allow-methods", b"GET, POST, OPTIONS"))
+            if requested_headers:
+                cors_headers.append((b"access-control-allow-headers", requested_headers))
+            cors_headers.append((b"access-control-max-age", b"600"))
+            await send({"type": "http.response.start", "status": 204, "headers": cors_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
@@ -3,19 +3,68 @@ import logging
 from typing import List, Dict, Tuple
 from urllib.parse import urljoin, urlparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import html
 
+from config import settings
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover - fall back to BeautifulSoup
+    HTMLParser = None
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:  # pragma: no cover - selectolax is the primary parser
+    BeautifulSoup = None
+
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used on every request
+_TAG_RE = re.compile(r'<[^>]+>')
+_IMG_RE = re.compile(r'<img[^>]+src="([^">]+)"')
+_WS_RE = re.compile(r'\s+')
+
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg')
+
+# Content areas to pull text from, in order of preference
+_CONTENT_SELECTORS = (
+    'article',
+    '.post-content',
+    '.entry-content',
+    '.content',
+    'main',
+    'body'
+)
+_CONTENT_SELECTOR = ', '.join(_CONTENT_SELECTORS)
+_SELECTOR_RANKS = {selector: rank for rank, selector in enumerate(_CONTENT_SELECTORS)}
+
+# Stop extracting page text once this many characters have been collected
+_TEXT_BUDGET = settings.max_text_length * 2
+
+# Upper bound on the size of a fetched page
+_MAX_FETCH_BYTES = 5 * 1024 * 1024
+_FETCH_CHUNK_SIZE = 64 * 1024
+
+# Shared session so all ContentFetcher instances reuse one connection pool
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+
 class ContentFetcher:
     """Service for fetching and extracting content from blog posts and URLs."""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.session = _SESSION
     
     def extract_from_html(self, html_content: str) -> Dict[str, List[str]]:
         """
@@ -28,13 +77,18 @@ class ContentFetcher:
             Dictionary with 'text' and 'images' lists
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Extract text content
-            text_content = self._extract_text(soup)
-            
-            # Extract images
-            images = self._extract_images(soup)
+            if HTMLParser is not None:
+                tree = HTMLParser(html_content)
+                
+                # Remove script and style elements
+                tree.strip_tags(['script', 'style'])
+                
+                text_content = self._extract_text(tree)
+                images = self._extract_images(tree)
+            else:
+                soup = BeautifulSoup(html_content, 'html.parser')
+                text_content = self._extract_text_bs4(soup)
+                images = self._extract_images_bs4(soup)
             
             return {
                 'text': text_content,
@@ -56,39 +110,75 @@ class ContentFetcher:
             Dictionary with 'text' and 'images' lists
         """
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                
+                # Read the body in chunks, stopping at the size limit
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=_FETCH_CHUNK_SIZE):
+                    body += chunk
+                    if len(body) >= _MAX_FETCH_BYTES:
+                        logger.warning(f"Truncating content from URL {url} at {_MAX_FETCH_BYTES} bytes")
+                        del body[_MAX_FETCH_BYTES:]
+                        break
+                
+                encoding = response.encoding or 'utf-8'
             
-            return self.extract_from_html(response.text)
+            try:
+                html_content = body.decode(encoding, errors='replace')
+            except LookupError:
+                # Unknown charset in the response headers
+                html_content = body.decode('utf-8', errors='replace')
+            
+            return self.extract_from_html(html_content)
             
         except Exception as e:
             logger.error(f"Error fetching content from URL {url}: {e}")
             return {'text': [], 'images': []}
     
-    def _extract_text(self, soup: BeautifulSoup) -> List[str]:
-        """Extract text content from BeautifulSoup object."""
-        text_content = []
+    def _extract_text(self, tree: "HTMLParser") -> List[str]:
+        """Extract text content from a selectolax tree."""
+        # Match all content areas in one traversal, then restore selector priority
+        nodes = tree.css(_CONTENT_SELECTOR)
+        nodes.sort(key=lambda node: self._selector_rank(
+            node.tag, (node.attributes.get('class') or '').split()
+        ))
         
+        unique_nodes = {node.mem_id: node for node in nodes}.values()
+        text_content = self._collect_text(
+            node.text(separator=' ', strip=True) for node in unique_nodes
+        )
+        
+        # If no content found, get all text
+        if not text_content and tree.root is not None:
+            text = tree.root.text(separator=' ', strip=True)
+            if text:
+                text_content.append(text)
+        
+        return text_content
+    
+    def _extract_images(self, tree: "HTMLParser") -> List[str]:
+        """Extract image URLs from a selectolax tree."""
+        return self._normalize_images(
+            node.attributes.get('src') for node in tree.css('img')
+        )
+    
+    def _extract_text_bs4(self, soup: "BeautifulSoup") -> List[str]:
+        """Extract text content from BeautifulSoup object."""
         # Remove script and style elements
         for script in soup(["script", "style"]):
             script.decompose()
         
-        # Extract text from various content areas
-        content_selectors = [
-            'article',
-            '.post-content',
-            '.entry-content',
-            '.content',
-            'main',
-            'body'
-        ]
-        
-        for selector in content_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text(separator=' ', strip=True)
-                if text and len(text) > 50:  # Only include substantial text
-                    text_content.append(text)
+        # Match all content areas in one traversal, then restore selector priority
+        elements = soup.select(_CONTENT_SELECTOR)
+        elements.sort(key=lambda element: self._selector_rank(
+            element.name, element.get('class') or []
+        ))
+        
+        unique_elements = {id(element): element for element in elements}.values()
+        text_content = self._collect_text(
+            element.get_text(separator=' ', strip=True) for element in unique_elements
+        )
         
         # If no content found, get all text
         if not text_content:
@@ -98,15 +188,56 @@ class ContentFetcher:
         
         return text_content
     
-    def _extract_images(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_images_bs4(self, soup: "BeautifulSoup") -> List[str]:
         """Extract image URLs from BeautifulSoup object."""
-        images = []
+        return self._normalize_images(img.get('src') for img in soup.find_all('img'))
+    
+    @staticmethod
+    def _collect_text(texts) -> List[str]:
+        """
+        Collect substantial, non-duplicate texts until the text budget is filled.
+        
+        Args:
+            texts: Iterable of candidate texts, evaluated lazily
+            
+        Returns:
+            List of text strings
+        """
+        text_content = []
+        seen = set()
+        total = 0
+        
+        for text in texts:
+            if not text or len(text) <= 50:  # Only include substantial text
+                continue
+            
+            text = text[:_TEXT_BUDGET]
+            key = hash(text[:256])
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            text_content.append(text)
+            total += len(text)
+            if total > _TEXT_BUDGET:
+                break
         
-        # Find all img tags
-        img_tags = soup.find_all('img')
+        return text_content
+    
+    @staticmethod
+    def _selector_rank(tag: str, classes: List[str]) -> int:
+        """Return the index of the first content selector matching the node itself."""
+        default = len(_CONTENT_SELECTORS)
+        rank = _SELECTOR_RANKS.get(tag, default)
+        for css_class in classes:
+            rank = min(rank, _SELECTOR_RANKS.get('.' + css_class, default))
+        return rank
+    
+    def _normalize_images(self, sources) -> List[str]:
+        """Clean image sources and keep only valid image URLs."""
+        images = []
         
-        for img in img_tags:
-            src = img.get('src')
+        for src in sources:
             if src:
                 # Clean and normalize URL
                 src = src.strip()
@@ -123,12 +254,11 @@ class ContentFetcher:
     
     def _is_valid_image_url(self, url: str) -> bool:
         """Check if URL is a valid image URL."""
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg']
         parsed = urlparse(url)
         
         # Check file extension
         path = parsed.path.lower()
-        if any(path.endswith(ext) for ext in image_extensions):
+        if path.endswith(_IMAGE_EXTENSIONS):
             return True
         
         # Check if it's a data URL
@@ -165,28 +295,24 @@ class ContentFetcher:
     
     def _extract_text_from_blocks(self, content: str) -> List[str]:
         """Extract text from Gutenberg blocks."""
-        text_content = []
+        body = HTMLParser(content).body if HTMLParser is not None else None
         
-        # Remove HTML tags but keep text
-        clean_text = re.sub(r'<[^>]+>', ' ', content)
-        clean_text = html.unescape(clean_text)
+        if body is not None:
+            # Single parse: drops tags and decodes entities in one pass
+            clean_text = body.text(separator=' ')
+        else:
+            # Remove HTML tags but keep text
+            clean_text = html.unescape(_TAG_RE.sub(' ', content))
         
-        # Split into paragraphs and clean
-        paragraphs = [p.strip() for p in clean_text.split('\n') if p.strip()]
-        
-        for paragraph in paragraphs:
-            if len(paragraph) > 20:  # Only include substantial paragraphs
-                text_content.append(paragraph)
-        
-        return text_content
+        # Split into paragraphs, keeping only substantial ones
+        return [p for line in clean_text.split('\n') if len(p := line.strip()) > 20]
     
     def _extract_images_from_content(self, content: str) -> List[str]:
         """Extract image URLs from content."""
         images = []
         
         # Find img tags
-        img_pattern = r'<img[^>]+src="([^">]+)"'
-        matches = re.findall(img_pattern, content)
+        matches = _IMG_RE.findall(content)
         
         for match in matches:
             if self._is_valid_image_url(match):
@@ -211,6 +337,6 @@ class ContentFetcher:
         combined = " ".join(text_list)
         
         # Remove extra whitespace
-        combined = re.sub(r'\s+', ' ', combined).strip()
+        combined = _WS_RE.sub(' ', combined).strip()
         
         return combined
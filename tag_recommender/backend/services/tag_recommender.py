@@ -1,7 +1,13 @@
 import asyncio
+import functools
+import heapq
 import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Dict
-from collections import Counter
+from collections import Counter, defaultdict
+from operator import itemgetter
 import numpy as np
 
 from models.tag_embeddings import TagEmbeddings
@@ -13,25 +19,106 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Cache hot-path settings once at import time
+MAX_TAGS = settings.max_tags
+MIN_CONF = settings.min_confidence
+MAX_LEN = settings.max_text_length
+W_TEXT, W_IMG, W_VID = settings.text_weight, settings.image_weight, settings.video_weight
+
+# Shared pool for running the blocking model calls off the event loop
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Background event loop shared by all synchronous callers, started on first use
+_LOOP = None
+_LOOP_LOCK = threading.Lock()
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it if needed."""
+    global _LOOP
+    if _LOOP is None:
+        with _LOOP_LOCK:
+            if _LOOP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="tag-recommender-loop", daemon=True
+                ).start()
+                _LOOP = loop
+    return _LOOP
+
+# A complete tag token (opening/closing/self-closing tag or comment opener);
+# stray '<' or '>' in plain text don't match
+_HTML_RE = re.compile(r'<(?:!--|/?[a-zA-Z][a-zA-Z0-9]*(?:\s[^<>]*)?/?>)')
+
+def _looks_like_html(text: str) -> bool:
+    """Cheap check for HTML content, so plain text skips extraction."""
+    return _HTML_RE.search(text) is not None
+
 class TagRecommender:
     """Main tag recommender service that combines BERT and CLIP recommendations."""
     
     def __init__(self):
         logger.info("Initializing TagRecommender...")
         
-        # Initialize tag embeddings
-        self.tag_embeddings = TagEmbeddings()
+        # Tag embeddings and models are loaded lazily on first use
+        self._tag_embeddings = None
+        self._bert = None
+        self._clip = None
+        self._video = None
+        self._model_lock = threading.Lock()
         
-        # Initialize individual recommenders
-        self.bert_recommender = BERTTagRecommender(self.tag_embeddings)
-        self.clip_recommender = CLIPTagRecommender(self.tag_embeddings)
-        self.video_recommender = VideoTagRecommender(self.tag_embeddings)
+        # Memoize BERT results so repeated texts skip the transformer encode
+        self._bert_cache = functools.lru_cache(maxsize=1024)(self._bert_encode)
         
         # Initialize content fetcher
         self.content_fetcher = ContentFetcher()
         
         logger.info("TagRecommender initialized successfully")
     
+    @property
+    def tag_embeddings(self) -> TagEmbeddings:
+        if self._tag_embeddings is None:
+            with self._model_lock:
+                if self._tag_embeddings is None:
+                    self._tag_embeddings = TagEmbeddings()
+        return self._tag_embeddings
+    
+    @property
+    def bert_recommender(self) -> BERTTagRecommender:
+        if self._bert is None:
+            tag_embeddings = self.tag_embeddings
+            with self._model_lock:
+                if self._bert is None:
+                    self._bert = BERTTagRecommender(tag_embeddings)
+        return self._bert
+    
+    @property
+    def clip_recommender(self) -> CLIPTagRecommender:
+        if self._clip is None:
+            tag_embeddings = self.tag_embeddings
+            with self._model_lock:
+                if self._clip is None:
+                    self._clip = CLIPTagRecommender(tag_embeddings)
+        return self._clip
+    
+    @property
+    def video_recommender(self) -> VideoTagRecommender:
+        if self._video is None:
+            tag_embeddings = self.tag_embeddings
+            with self._model_lock:
+                if self._video is None:
+                    self._video = VideoTagRecommender(tag_embeddings)
+        return self._video
+    
+    def warm_up(self) -> None:
+        """Load all models ahead of the first recommendation request."""
+        try:
+            self.bert_recommender
+            self.clip_recommender
+            self.video_recommender
+            logger.info("TagRecommender models loaded")
+        except Exception as e:
+            logger.error(f"Error warming up models: {e}")
+    
     async def get_recommendations(
         self, 
         text: str = "", 
@@ -56,14 +143,25 @@ class TagRecommender:
             # Process text content
             processed_text = self._process_text(text)
             
-            # Get BERT recommendations for text
-            bert_tags, bert_scores = self.bert_recommender.get_recommendations(processed_text)
-            
-            # Get CLIP recommendations for images
-            clip_tags, clip_scores = self.clip_recommender.get_recommendations(images)
+            # Run BERT, CLIP and video recommenders concurrently; models are
+            # resolved inside the workers so a first-time load never blocks the loop
+            loop = asyncio.get_running_loop()
+            t_bert = loop.run_in_executor(
+                _EXECUTOR, self._get_bert_recommendations, processed_text
+            )
+            t_clip = loop.run_in_executor(
+                _EXECUTOR, lambda: self.clip_recommender.get_recommendations(images)
+            )
+            t_video = loop.run_in_executor(
+                _EXECUTOR, lambda: self.video_recommender.get_recommendations(videos)
+            )
+            bert, clip, video = await asyncio.gather(
+                t_bert, t_clip, t_video, return_exceptions=True
+            )
             
-            # Get video recommendations for videos
-            video_tags, video_scores = self.video_recommender.get_recommendations(videos)
+            bert_tags, bert_scores = self._branch_result("BERT", bert)
+            clip_tags, clip_scores = self._branch_result("CLIP", clip)
+            video_tags, video_scores = self._branch_result("video", video)
             
             # Combine recommendations
             final_tags, final_scores = self._combine_recommendations(
@@ -77,20 +175,38 @@ class TagRecommender:
             logger.error(f"Error in tag recommendation: {e}")
             return [], []
     
+    def _bert_encode(self, text: str) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+        """Run the BERT recommender, returning immutable results for caching."""
+        tags, scores = self.bert_recommender.get_recommendations(text)
+        return tuple(tags), tuple(scores)
+    
+    def _get_bert_recommendations(self, text: str) -> Tuple[List[str], List[float]]:
+        """Get BERT recommendations for text, served from cache when possible."""
+        tags, scores = self._bert_cache(text)
+        return list(tags), list(scores)
+    
+    @staticmethod
+    def _branch_result(name: str, result) -> Tuple[List[str], List[float]]:
+        """Unpack a recommender result, falling back to empty lists on error."""
+        if isinstance(result, BaseException):
+            logger.error(f"Error in {name} recommendations: {result}")
+            return [], []
+        return result
+    
     def _process_text(self, text: str) -> str:
         """Process and clean text content."""
         if not text:
             return ""
         
         # Extract content if it's WordPress/Gutenberg content
-        if '<' in text and '>' in text:
+        if _looks_like_html(text):
             extracted = self.content_fetcher.extract_from_wordpress_content(text)
             text_parts = extracted['text']
             text = self.content_fetcher.combine_content(text_parts)
         
         # Truncate if too long
-        if len(text) > settings.max_text_length:
-            text = text[:settings.max_text_length] + "..."
+        if len(text) > MAX_LEN:
+            text = text[:MAX_LEN] + "..."
         
         return text.strip()
     
@@ -115,42 +231,26 @@ class TagRecommender:
         Returns:
             Tuple of (final_tags, final_scores)
         """
-        # Create tag-score mappings
-        bert_dict = dict(zip(bert_tags, bert_scores))
-        clip_dict = dict(zip(clip_tags, clip_scores))
-        video_dict = dict(zip(video_tags or [], video_scores or []))
-        
-        # Get all unique tags
-        all_tags = set(bert_tags + clip_tags + (video_tags or []))
+        # Accumulate weighted scores (defaults: text 50%, image 30%, video 20%)
+        # straight from each branch, without intermediate dicts or tag sets
+        combined_scores = defaultdict(float)
         
-        # Calculate combined scores
-        combined_scores = {}
+        for tag, score in zip(bert_tags, bert_scores):
+            combined_scores[tag] += W_TEXT * score
+        for tag, score in zip(clip_tags, clip_scores):
+            combined_scores[tag] += W_IMG * score
+        for tag, score in zip(video_tags or (), video_scores or ()):
+            combined_scores[tag] += W_VID * score
         
-        for tag in all_tags:
-            bert_score = bert_dict.get(tag, 0.0)
-            clip_score = clip_dict.get(tag, 0.0)
-            video_score = video_dict.get(tag, 0.0)
-            
-            # Weighted combination (text: 50%, image: 30%, video: 20%)
-            combined_score = (
-                0.5 * bert_score + 
-                0.3 * clip_score +
-                0.2 * video_score
-            )
-            
-            if combined_score >= settings.min_confidence:
-                combined_scores[tag] = combined_score
-        
-        # Sort by score and get top tags
-        sorted_tags = sorted(
-            combined_scores.items(), 
-            key=lambda x: x[1], 
-            reverse=True
+        # Select the top max_tags above min confidence without sorting every tag
+        top = heapq.nlargest(
+            MAX_TAGS,
+            ((tag, score) for tag, score in combined_scores.items() if score >= MIN_CONF),
+            key=itemgetter(1)
         )
         
-        # Limit to max_tags
-        final_tags = [tag for tag, score in sorted_tags[:settings.max_tags]]
-        final_scores = [score for tag, score in sorted_tags[:settings.max_tags]]
+        final_tags = [tag for tag, score in top]
+        final_scores = [score for tag, score in top]
         
         return final_tags, final_scores
     
@@ -163,14 +263,10 @@ class TagRecommender:
         """
         Synchronous version of get_recommendations for non-async contexts.
         """
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(
-                self.get_recommendations(text, images, videos)
-            )
-        finally:
-            loop.close()
+        future = asyncio.run_coroutine_threadsafe(
+            self.get_recommendations(text, images, videos), _get_background_loop()
+        )
+        return future.result()
     
     def get_available_tags(self) -> List[str]:
         """Get list of all available tags."""
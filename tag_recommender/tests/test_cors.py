@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from middleware import MinimalCORS
+
+def make_client(allow_origins):
+    """Build a small app wrapped in MinimalCORS."""
+    app = FastAPI()
+    app.add_middleware(MinimalCORS, allow_origins=allow_origins)
+
+    @app.post("/recommend/json")
+    async def recommend():
+        return {"tags": []}
+
+    return TestClient(app)
+
+def test_wildcard_simple_response():
+    """Allow-all mode adds a wildcard origin to normal responses."""
+    client = make_client(("*",))
+    response = client.post("/recommend/json", headers={"Origin": "https://blog.example.com"})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "vary" not in response.headers
+
+def test_allowed_origin_is_echoed():
+    """An allow-listed origin is echoed back with Vary: Origin."""
+    client = make_client(("https://blog.example.com",))
+    response = client.post("/recommend/json", headers={"Origin": "https://blog.example.com"})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "https://blog.example.com"
+    assert response.headers["vary"] == "Origin"
+
+def test_disallowed_origin_gets_no_allow_header():
+    """A disallowed origin gets no allow-origin header but still varies on Origin."""
+    client = make_client(("https://blog.example.com",))
+    response = client.post("/recommend/json", headers={"Origin": "https://evil.example.com"})
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+    assert response.headers["vary"] == "Origin"
+
+def test_preflight_is_answered_directly():
+    """A CORS preflight is answered with 204 and the allowed methods/headers."""
+    client = make_client(("*",))
+    response = client.options("/recommend/json", headers={
+        "Origin": "https://blog.example.com",
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "content-type",
+    })
+    assert response.status_code == 204
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-allow-headers"] == "content-type"
+
+def test_plain_options_reaches_app():
+    """OPTIONS requests that are not preflights are passed through to the app."""
+    client = make_client(("*",))
+    response = client.options("/recommend/json")
+    assert response.status_code == 405
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,130 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from services import fetch_content
+from services.fetch_content import ContentFetcher
+
+ARTICLE = "Article text about machine learning and neural networks. " * 2
+ENTRY = "Entry content about data science and statistics in practice. " * 2
+MAIN = "Main area introduction that sits above the entry content block. " * 2
+
+NESTED_HTML = f"""
+<html><body>
+<main>{MAIN}<div class="entry-content">{ENTRY}</div></main>
+<article>{ARTICLE}</article>
+</body></html>
+"""
+
+@pytest.fixture(params=["selectolax", "bs4"])
+def fetcher(request, monkeypatch):
+    """ContentFetcher running on each available HTML parser."""
+    pytest.importorskip(request.param)
+    if request.param == "bs4":
+        monkeypatch.setattr(fetch_content, "HTMLParser", None)
+    return ContentFetcher()
+
+def test_extract_text_follows_selector_priority(fetcher):
+    """Nested content areas are returned in selector order, not document order."""
+    text = fetcher.extract_from_html(NESTED_HTML)['text']
+
+    assert len(text) == 4
+    assert text[0] == ARTICLE.strip()
+    assert text[1] == ENTRY.strip()
+    assert text[2].startswith(MAIN.strip())
+    assert ARTICLE.strip() in text[3] and MAIN.strip() in text[3]
+
+def test_extract_text_stops_at_budget(fetcher, monkeypatch):
+    """Preferred content is kept and boilerplate is truncated once the budget fills."""
+    monkeypatch.setattr(fetch_content, "_TEXT_BUDGET", 300)
+    html = f"""
+    <html><body>
+    <nav>{"Navigation link " * 100}</nav>
+    <div class="entry-content">{ENTRY}</div>
+    <article>{ARTICLE}</article>
+    </body></html>
+    """
+
+    text = fetcher.extract_from_html(html)['text']
+
+    assert text[:2] == [ARTICLE.strip(), ENTRY.strip()]
+    assert len(text) == 3
+    assert len(text[2]) == 300
+
+def test_extract_text_skips_duplicate_blocks(fetcher):
+    """Wrappers with the same text as an already collected block are dropped."""
+    html = f'<html><body><div class="content"><article>{ARTICLE}</article></div></body></html>'
+
+    assert fetcher.extract_from_html(html)['text'] == [ARTICLE.strip()]
+
+class FakeResponse:
+    """Streamed response yielding a fixed body in chunks."""
+
+    def __init__(self, body, encoding="utf-8", chunk_size=1024):
+        self.body = body
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self.chunks_read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        for start in range(0, len(self.body), self.chunk_size):
+            self.chunks_read += 1
+            yield self.body[start:start + self.chunk_size]
+
+class FakeSession:
+    """Session returning a single prepared response."""
+
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, **kwargs):
+        return self.response
+
+@pytest.fixture
+def captured_html(monkeypatch):
+    """Capture the HTML that fetch_from_url hands to the parser."""
+    captured = []
+
+    def fake_extract(self, html_content):
+        captured.append(html_content)
+        return {'text': [], 'images': []}
+
+    monkeypatch.setattr(ContentFetcher, "extract_from_html", fake_extract)
+    return captured
+
+def test_fetch_from_url_caps_body_size(monkeypatch, captured_html):
+    """Pages over the size limit are truncated and not read to the end."""
+    monkeypatch.setattr(fetch_content, "_MAX_FETCH_BYTES", 4096)
+    response = FakeResponse(b"a" * 100_000)
+    fetcher = ContentFetcher()
+    fetcher.session = FakeSession(response)
+
+    fetcher.fetch_from_url("https://example.com/big")
+
+    assert captured_html == ["a" * 4096]
+    assert response.chunks_read == 4
+
+def test_fetch_from_url_unknown_charset_falls_back_to_utf8(monkeypatch, captured_html):
+    """An unknown charset in the headers decodes as UTF-8 instead of failing."""
+    response = FakeResponse("<p>café</p>".encode("utf-8"), encoding="utf8mb4")
+    fetcher = ContentFetcher()
+    fetcher.session = FakeSession(response)
+
+    fetcher.fetch_from_url("https://example.com/post")
+
+    assert captured_html == ["<p>café</p>"]
+
+if __name__ == "__main__":
+    pytest.main([__file__])
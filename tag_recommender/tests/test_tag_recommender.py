@@ -0,0 +1,111 @@
+import asyncio
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+# Stub the model modules so the service logic can be tested without model weights
+sys.modules.setdefault("models", types.ModuleType("models"))
+for module_name, class_name in [
+    ("models.tag_embeddings", "TagEmbeddings"),
+    ("models.bert_model", "BERTTagRecommender"),
+    ("models.clip_model", "CLIPTagRecommender"),
+    ("models.video_model", "VideoTagRecommender"),
+]:
+    if module_name not in sys.modules:
+        module = types.ModuleType(module_name)
+        setattr(module, class_name, type(class_name, (), {}))
+        sys.modules[module_name] = module
+
+from services import tag_recommender
+from services.tag_recommender import TagRecommender, _looks_like_html
+
+class StubRecommender:
+    """Recommender returning a fixed result, or raising it if it is an exception."""
+
+    def __init__(self, result):
+        self.result = result
+
+    def get_recommendations(self, content):
+        if isinstance(self.result, BaseException):
+            raise self.result
+        return self.result
+
+@pytest.fixture
+def recommender(monkeypatch):
+    """TagRecommender with fixed weights and limits, and no models loaded."""
+    monkeypatch.setattr(tag_recommender, "W_TEXT", 0.5)
+    monkeypatch.setattr(tag_recommender, "W_IMG", 0.3)
+    monkeypatch.setattr(tag_recommender, "W_VID", 0.2)
+    monkeypatch.setattr(tag_recommender, "MIN_CONF", 0.3)
+    monkeypatch.setattr(tag_recommender, "MAX_TAGS", 2)
+    return TagRecommender()
+
+@pytest.mark.parametrize("text", [
+    "<!-- wp:paragraph --><p>Gutenberg paragraph</p><!-- /wp:paragraph -->",
+    'Intro <strong>bold</strong> <a href="https://example.com">link</a> &amp; more',
+    "<ul><li>first</li><li>second</li></ul>",
+    "Plain intro text. " * 100 + "<em>late markup</em>",
+])
+def test_looks_like_html_detects_markup(text):
+    """WordPress block, classic editor and late markup are all treated as HTML."""
+    assert _looks_like_html(text)
+
+@pytest.mark.parametrize("text", [
+    "This is plain text about math: 1 < 2 > 0",
+    "Binary search runs while lo<hi and more",
+    "We show that a<b implies f(a)<f(b)",
+    "Arrows like a -> b and b <- a are not tags",
+    "",
+])
+def test_looks_like_html_ignores_plain_text(text):
+    """Plain text containing '<' and '>' skips HTML extraction."""
+    assert not _looks_like_html(text)
+
+def test_combine_sums_weighted_scores_across_branches(recommender):
+    """A tag found by several branches gets the sum of its weighted scores."""
+    tags, scores = recommender._combine_recommendations(
+        ["ai"], [0.6], ["ai"], [0.5], ["ai"], [0.5]
+    )
+    assert tags == ["ai"]
+    assert scores == [pytest.approx(0.5 * 0.6 + 0.3 * 0.5 + 0.2 * 0.5)]
+
+def test_combine_filters_and_limits_tags(recommender):
+    """Tags below min confidence are dropped and only the top MAX_TAGS are kept."""
+    tags, scores = recommender._combine_recommendations(
+        ["travel", "food", "ai", "rare"], [0.7, 0.8, 0.9, 0.4], [], []
+    )
+    assert tags == ["ai", "food"]
+    assert scores == [pytest.approx(0.45), pytest.approx(0.4)]
+
+def test_combine_handles_missing_video(recommender):
+    """Video results are optional."""
+    assert recommender._combine_recommendations([], [], ["beach"], [1.0]) == (["beach"], [pytest.approx(0.3)])
+
+def test_branch_result_passes_results_through():
+    """Successful branch results are returned unchanged."""
+    result = (["ai"], [0.9])
+    assert TagRecommender._branch_result("BERT", result) is result
+
+def test_branch_result_falls_back_on_error():
+    """A failed branch contributes no tags."""
+    assert TagRecommender._branch_result("CLIP", RuntimeError("boom")) == ([], [])
+
+def test_failed_branch_does_not_fail_request(recommender):
+    """Tags from healthy branches are still returned when one branch raises."""
+    recommender._bert = StubRecommender((["ai"], [0.8]))
+    recommender._clip = StubRecommender(RuntimeError("image download failed"))
+    recommender._video = StubRecommender(([], []))
+
+    tags, scores = asyncio.run(recommender.get_recommendations(
+        text="A post about machine learning", images=["https://example.com/a.jpg"]
+    ))
+
+    assert tags == ["ai"]
+    assert scores == [pytest.approx(0.4)]
+
+if __name__ == "__main__":
+    pytest.main([__file__])